@@ -61,7 +61,10 @@ class Villain(ReadWriteable):
             $S_0[\phi, n]$.  We assume the path integration over $v$ implements :ref:`the winding constraint <winding constraint>` in some clever way,
             so the action does not depend on $v$.
         '''
-        return self.kappa / 2 * np.sum((self.Lattice.d(0, phi) - 2*np.pi*n)**2) # + nothing that depends on v since we will implement the constraint directly.
+        links = self.Lattice.d(0, phi)
+        links -= 2*np.pi*n
+        # The dot product reduces the squares without materializing them.
+        return self.kappa / 2 * np.vdot(links, links) # + nothing that depends on v since we will implement the constraint directly.
 
     def configurations(self, count):
         r'''
@@ -74,7 +74,9 @@ class Worldline(ReadWriteable):
 
         if not self.valid(m):
             raise ValueError(f'The one-form m does not satisfy the constraint δm = 0 everywhere.')
-        return 0.5 / self.kappa * np.sum((m - self.Lattice.delta(2, v) / self.W)**2) + self._constant_offset
+        links = m - self.Lattice.delta(2, v) / self.W
+        # The dot product reduces the squares without materializing them.
+        return 0.5 / self.kappa * np.vdot(links, links) + self._constant_offset
 
     def configurations(self, count):
         r'''
@@ -65,10 +65,19 @@ class Extendable(ReadWriteable):
         logger.info(f'Extending h5 {group.name}.')
 
         for attr, value in self.__dict__.items():
+            if not isinstance(value, (Extendable, array)):
+                continue
+
+            # Just like to_h5, private attributes live in the _ group without their leading underscore.
+            if attr[0] == '_':
+                where, key = group['_'], attr[1:]
+            else:
+                where, key = group, attr
+
             if isinstance(value, Extendable):
-                value.extend_h5(group[attr])
-            elif isinstance(value, array):
-                strategy.extend(group, attr, value)
+                value.extend_h5(where[key])
+            else:
+                strategy.extend(where, key, value)
 
 def _example_extend(cls, first, then, filename):
 
@@ -18,8 +18,14 @@ def _dimension(n):
     -------
         an FFT-convention-compatible list of coordinates for a dimension of size n,
         ``[0, 1, 2, ... max, min ... -2, -1]``.
+        The dtype is ``np.intp``, numpy's native indexing type, so that coordinates (and everything built from them)
+        can be used for fancy indexing without an implicit cast.
+
+    .. note ::
+        Narrowing to ``int32`` would not save any meaningful bandwidth: coordinate arrays only have one entry per site,
+        and numpy would silently convert them back to ``np.intp`` every time they are used as an index.
     '''
-    return np.array(list(range(0, n // 2 + 1)) + list(range( - n // 2 + 1, 0)), dtype=int)
+    return np.array(list(range(0, n // 2 + 1)) + list(range( - n // 2 + 1, 0)), dtype=np.intp)
 
 class Lattice2D(ReadWriteable):
 
@@ -50,29 +56,66 @@ class Lattice2D(ReadWriteable):
         self.links = self.dim * self.sites
         self.plaquettes = self.sites # 2D!
 
-        self.t = _dimension(self.nt)
+        self.point_group_operations = np.array((
+                    # Matches the order of the (a,b) orbit in docs/D4.rst
+                    # That makes it easy to read off the weights
+                    ((+1,0),(0,+1)), # identity
+                    ((0,+1),(+1,0)), # reflect across y=+x
+                    ((0,-1),(+1,0)), # rotate(π/2)
+                    ((-1,0),(0,+1)), # reflect across y-axis
+                    ((-1,0),(0,-1)), # rotate(π) = inversion
+                    ((0,-1),(-1,0)), # reflect across y=-x
+                    ((0,+1),(-1,0)), # rotate(3π/2)
+                    ((+1,0),(0,-1)), # reflect across x-axis
+                ), dtype=np.intp)
+
+        self.point_group_weights = {
+            'A1': np.array((+1,+1,+1,+1,+1,+1,+1,+1))/8 + 0.j,
+            'A2': np.array((+1,-1,+1,-1,+1,-1,+1,-1))/8 + 0.j,
+            'B1': np.array((+1,-1,-1,+1,+1,-1,-1,+1))/8 + 0.j,
+            'B2': np.array((+1,+1,-1,-1,+1,+1,-1,-1))/8 + 0.j,
+            "E+": np.array((+1,+1j,+1j,-1,-1,-1j,-1j,+1))/8,
+            "E-": np.array((+1,-1j,-1j,-1,-1,+1j,+1j,+1))/8,
+            "E'+": np.array((+1,-1j,+1j,+1,-1,+1j,-1j,-1))/8,
+            "E'-": np.array((+1,+1j,-1j,+1,-1,-1j,+1j,-1))/8,
+        }
+        self.point_group_irreps = tuple(self.point_group_weights.keys())
+
+    # The coordinate arrays are only built when they are first needed, since many uses of a lattice
+    # (making forms, differentiating them, Fourier transforming them, ...) never touch them.
+    # Lattices read from HDF5 that already have them stored use the stored values.
+
+    @cached_property
+    def t(self):
         r'''
         The coordinates in the t direction.
 
-        >>> lattice = Lattice2D(5)
+        >>> import supervillain
+        >>> lattice = supervillain.lattice.Lattice2D(5)
         >>> lattice.t
         array([ 0,  1,  2, -2, -1])
         '''
+        return _dimension(self.nt)
 
-        self.x = _dimension(self.nx)
+    @cached_property
+    def x(self):
         r'''
         The coordinates in the x direction.
 
-        >>> lattice = Lattice2D(5)
+        >>> import supervillain
+        >>> lattice = supervillain.lattice.Lattice2D(5)
         >>> lattice.x
         array([ 0,  1,  2, -2, -1])
         '''
+        return _dimension(self.nx)
 
-        self.T = np.tile( self.t, (self.nx, 1)).transpose()
+    @cached_property
+    def T(self):
         r'''
         An array of size ``dims`` with the t coordinate as a value.
 
-        >>> lattice = Lattice(5)
+        >>> import supervillain
+        >>> lattice = supervillain.lattice.Lattice2D(5)
         >>> lattice.T
         array([[ 0,  0,  0,  0,  0],
                [ 1,  1,  1,  1,  1],
@@ -80,11 +123,15 @@ class Lattice2D(ReadWriteable):
                [-2, -2, -2, -2, -2],
                [-1, -1, -1, -1, -1]])
         '''
-        self.X = np.tile( self.x, (self.nt, 1))
+        return np.tile( self.t, (self.nx, 1)).transpose()
+
+    @cached_property
+    def X(self):
         r'''
         An array of size ``dims`` with the y coordinate as a value.
 
-        >>> lattice = Lattice(5)
+        >>> import supervillain
+        >>> lattice = supervillain.lattice.Lattice2D(5)
         >>> lattice.X
         array([[ 0,  1,  2, -2, -1],
                [ 0,  1,  2, -2, -1],
@@ -92,15 +139,15 @@ class Lattice2D(ReadWriteable):
                [ 0,  1,  2, -2, -1],
                [ 0,  1,  2, -2, -1]])
         '''
+        return np.tile( self.x, (self.nt, 1))
 
-        # We also construct a linearized list of coordinates.
-        # The order matches self.X.ravel() and self.Y.ravel()
-        self.coordinates = np.stack((self.T.flatten(), self.X.flatten())).transpose()
-        '''
+    @cached_property
+    def coordinates(self):
+        r'''
         An array of size ``[sites, len(dims)]``.  Each row contains a pair of coordinates.  The order matches ``{T,X}.flatten()``.
 
-        >>> lattice = Lattice(5)
-        >>> lattice.coordinates
+        >>> import supervillain
+        >>> lattice = supervillain.lattice.Lattice2D(5)
         >>> lattice.coordinates
         array([[ 0,  0],
                [ 0,  1],
@@ -128,31 +175,9 @@ class Lattice2D(ReadWriteable):
                [-1, -2],
                [-1, -1]])
         '''
-
-        self.point_group_operations = np.array((
-                    # Matches the order of the (a,b) orbit in docs/D4.rst
-                    # That makes it easy to read off the weights
-                    ((+1,0),(0,+1)), # identity
-                    ((0,+1),(+1,0)), # reflect across y=+x
-                    ((0,-1),(+1,0)), # rotate(π/2)
-                    ((-1,0),(0,+1)), # reflect across y-axis
-                    ((-1,0),(0,-1)), # rotate(π) = inversion
-                    ((0,-1),(-1,0)), # reflect across y=-x
-                    ((0,+1),(-1,0)), # rotate(3π/2)
-                    ((+1,0),(0,-1)), # reflect across x-axis
-                ))
-
-        self.point_group_weights = {
-            'A1': np.array((+1,+1,+1,+1,+1,+1,+1,+1))/8 + 0.j,
-            'A2': np.array((+1,-1,+1,-1,+1,-1,+1,-1))/8 + 0.j,
-            'B1': np.array((+1,-1,-1,+1,+1,-1,-1,+1))/8 + 0.j,
-            'B2': np.array((+1,+1,-1,-1,+1,+1,-1,-1))/8 + 0.j,
-            "E+": np.array((+1,+1j,+1j,-1,-1,-1j,-1j,+1))/8,
-            "E-": np.array((+1,-1j,-1j,-1,-1,+1j,+1j,+1))/8,
-            "E'+": np.array((+1,-1j,+1j,+1,-1,+1j,-1j,-1))/8,
-            "E'-": np.array((+1,+1j,-1j,+1,-1,-1j,+1j,-1))/8,
-        }
-        self.point_group_irreps = tuple(self.point_group_weights.keys())
+        # The order matches self.X.ravel() and self.Y.ravel()
+        # Stacking on the last axis gives a C-contiguous [sites, 2] array directly, so that each pair is adjacent in memory.
+        return np.stack((self.T, self.X), axis=-1).reshape(-1, self.dim)
 
     def __str__(self):
         return f'Lattice2D({self.nt},{self.nx})'
@@ -177,11 +202,16 @@ class Lattice2D(ReadWriteable):
                 The output is the same shape as the input.
         '''
 
-        modded = np.mod(x, self.dims).transpose()
-        return np.stack((
-                self.t[modded[0]],
-                self.x[modded[1]]
-                )).transpose()
+        # Rather than mod into [0, n) and then look up the coordinate in t or x, shift by c = (n-1)//2 first,
+        # so that the mod lands directly in [-c, n-1-c], which is exactly the range of _dimension(n), and shift back.
+        # Broadcasting a different modulus over each pair is much slower than a scalar modulus, so use one when we can.
+        n = self.nx if self.nt == self.nx else np.array(self.dims)
+        c = (n - 1) // 2
+
+        r = np.add(x, c)
+        np.mod(r, n, out=r)
+        r -= c
+        return r
 
     def distance_squared(self, a, b):
         r'''
@@ -203,10 +233,9 @@ class Lattice2D(ReadWriteable):
                 Either ``a`` and ``b`` both hold the same number of coordinate pairs, or one is a singleton.
         '''
         d = self.mod(a-b)
-        if d.ndim == 1:
-            return np.sum(d**2)
-
-        return np.sum(d**2, axis=(1,))
+        # Contracting the last axis handles a single pair and any number of pairs alike,
+        # without a squared temporary or a slow reduction over an axis of length 2.
+        return np.einsum('...i,...i->...', d, d)
 
     def roll(self, data, shift, axes=(-2,-1)):
         
@@ -237,20 +266,22 @@ class Lattice2D(ReadWriteable):
 
         # We'll build up the new shape by considering each index left-to-right.
         # So, for negative indices we need to mod them by the number of dimensions.
-        to_reshape = np.sort(np.remainder(np.array(dims), v_dims))
-        
-        new_shape = ()
+        # The shape is just python ints, so there's no reason to build it out of arrays.
+        to_reshape = sorted(d % v_dims for d in dims)
+        unflatten = set(to_reshape)
+
+        new_shape = []
         for i, s in enumerate(v.shape):
-            new_shape += ((s,) if i not in to_reshape else self.dims)
+            new_shape.extend(self.dims if i in unflatten else (s,))
 
         reshaped = v.reshape(new_shape)
         if not center_origin:
             return reshaped
         
-        axes = to_reshape + np.arange(len(to_reshape))
+        # Each unflattened dimension before a given one pushes it one axis further right.
         shifts = (self.nt // 2, self.nx // 2)
-        for a in axes:
-            reshaped = reshaped.roll(shifts, dims=(a,a+1))
+        for i, d in enumerate(to_reshape):
+            reshaped = self.roll(reshaped, shifts, axes=(d+i, d+i+1))
 
         return reshaped
 
@@ -296,10 +327,8 @@ class Lattice2D(ReadWriteable):
         shape   = v.shape
         v_dims  = len(shape)
         
-        dm = set(dims)
-        
-        future_dims = v_dims - (len(self.dims)-1) * len(dm)
-        dm = set(d % future_dims for d in dm)
+        future_dims = v_dims - (len(self.dims)-1) * len(set(dims))
+        dm = {d % future_dims for d in dims}
         
         new_shape = []
         idx = 0
@@ -322,7 +351,7 @@ class Lattice2D(ReadWriteable):
             Perhaps this happened with your vector of shape {v.shape} and {dims=}?
             ''') from error
 
-    def form(self, p, count=None, dtype=float):
+    def form(self, p, count=None, dtype=float, out=None):
         r'''
         Parameters
         ----------
@@ -332,6 +361,9 @@ class Lattice2D(ReadWriteable):
                 How many forms to return.
             dtype:
                 Data type (float, int, etc.)
+            out: np.ndarray
+                If provided, no new memory is allocated.  Instead ``out``, which must hold exactly the right number of elements, is zeroed
+                and a view of it with the appropriate shape is returned; ``dtype`` is ignored in favor of ``out.dtype``.
 
         Returns
         -------
@@ -351,18 +383,36 @@ class Lattice2D(ReadWriteable):
 
                 Notice that the 1-form has an extra dimension compared to the 0 form (because there are 2 links per site in 2 dimensions) and the 2-form has the same shape as sites (which is special to 2D).
                 The spacetime dependence is last because :func:`~coordinatize` and :func:`~Lattice2D.linearize` default to the last dimension.
-        '''
-        if count is None:
-            return self.form(p, count=1, dtype=dtype)[0]
 
+        .. note ::
+            Many forms should be held in one array with the batch dimension first, as the :class:`~.Villain` and :class:`~.Worldline` ``configurations`` do,
+            so that a whole history is contiguous and reductions over it are cache-friendly.
+            Rather than allocating one form at a time, allocate ``form(p, count)`` once and index into it, or reuse an existing buffer with ``out``.
+
+            >>> buffer = np.empty(2*3*3*7)
+            >>> L.form(1, 7, out=buffer).shape
+            (7, 2, 3, 3)
+        '''
         if p == 0:
-            return np.zeros((count,) + self.dims, dtype=dtype)
+            shape = self.dims
         elif p == 1:
-            return np.zeros((count, self.dim) + self.dims, dtype=dtype)
+            shape = (self.dim, ) + self.dims
         elif p == 2:
-            return np.zeros((count, ) + self.dims, dtype=dtype) # 2D
+            shape = self.dims # 2D
         else:
-            raise ValueError("It's a 2D lattice, you can't have a {p}-form.")
+            raise ValueError(f"It's a 2D lattice, you can't have a {p}-form.")
+
+        if count is not None:
+            shape = (count, ) + shape
+
+        if out is None:
+            return np.zeros(shape, dtype=dtype)
+
+        form = out.reshape(shape)
+        if not np.shares_memory(form, out):
+            raise ValueError(f'A {p}-form cannot be a view of a non-contiguous buffer of shape {out.shape}.')
+        form[...] = 0
+        return form
 
     def d(self, p, form):
         r'''
@@ -379,16 +429,26 @@ class Lattice2D(ReadWriteable):
         -------
             np.ndarray:
                 d(0-form) = 1-form, d(1-form) = 2-form, d(2-form) = 0.
+
+        .. note ::
+            Any leading axes, such as the configuration axis of a whole ensemble's worth of forms, are broadcast over.
         '''
+        # Rather than np.roll, which has to figure out the shifted slices and copy on every call,
+        # we gather the forward neighbors using the precomputed _forward table.
         if p == 0:
 
-            return np.stack(tuple(
-                np.roll(form, shift=-1, axis=a) - form for a, _ in enumerate(self.dims)
-            ))
+            batch = form.shape[:-2]
+            result = form.reshape(batch + (-1,)).take(self._forward, axis=-1).reshape(batch + (self.dim, ) + self.dims)
+            result -= form[..., None, :, :]
+            return result
 
         elif p == 1:
 
-            return form[0] + np.roll(form[1], shift=-1, axis=0) - np.roll(form[0], shift=-1, axis=1) - form[1]
+            batch = form.shape[:-3]
+            flat = form.reshape(batch + (self.dim, -1))
+            t_forward = flat[..., 1, :].take(self._forward[0], axis=-1).reshape(batch + self.dims)
+            x_forward = flat[..., 0, :].take(self._forward[1], axis=-1).reshape(batch + self.dims)
+            return form[..., 0, :, :] + t_forward - x_forward - form[..., 1, :, :]
 
         elif p == 2:
 
@@ -412,18 +472,29 @@ class Lattice2D(ReadWriteable):
         -------
             np.ndarray:
                 δ(2-form) = 1-form, δ(1-form) = 0-form, δ(0-form) = 0.
+
+        .. note ::
+            As with :func:`~.d`, any leading axes are broadcast over.
         '''
+        # As in d, we gather the (now backward) neighbors using a precomputed table rather than rolling.
         if p == 0:
             return 0
 
         elif p == 1:
-            return self.roll(form[0], (+1,0)) + self.roll(form[1], (0,+1)) - form[0] - form[1]
+            batch = form.shape[:-3]
+            flat = form.reshape(batch + (self.dim, -1))
+            t_backward = flat[..., 0, :].take(self._backward[0], axis=-1).reshape(batch + self.dims)
+            x_backward = flat[..., 1, :].take(self._backward[1], axis=-1).reshape(batch + self.dims)
+            return t_backward + x_backward - form[..., 0, :, :] - form[..., 1, :, :]
 
         elif p == 2:
-            return np.stack((
-                form - self.roll(form, (0,+1)),
-                self.roll(form, (+1,0)) - form,
-                ))
+            # Gathering in reversed order puts the x-neighbors in the t-component and vice-versa,
+            # so we can finish in place.
+            batch = form.shape[:-2]
+            result = form.reshape(batch + (-1,)).take(self._backward[::-1], axis=-1).reshape(batch + (self.dim, ) + self.dims)
+            np.subtract(form, result[..., 0, :, :], out=result[..., 0, :, :])
+            result[..., 1, :, :] -= form
+            return result
 
         else:
             raise ValueError("It's a 2D lattice, you can't have a {p}-form.")
@@ -433,6 +504,24 @@ class Lattice2D(ReadWriteable):
     Alias for :func:`delta <supervillain.lattice.Lattice2D.delta>`.
     '''
 
+    @cached_property
+    def _forward(self):
+        r'''
+        An array of shape ``[dim, sites]``.  For every site (in linearized order) and direction, the linearized index of the neighboring site one step forward in that direction.
+        Equivalent to, but much cheaper to apply than, ``np.roll(form, shift=-1, axis=direction)``.
+        '''
+        index = np.arange(self.sites).reshape(self.dims)
+        return np.stack([np.roll(index, shift=-1, axis=a) for a in range(self.dim)]).reshape(self.dim, self.sites)
+
+    @cached_property
+    def _backward(self):
+        r'''
+        An array of shape ``[dim, sites]``.  For every site (in linearized order) and direction, the linearized index of the neighboring site one step backward in that direction.
+        Equivalent to, but much cheaper to apply than, ``np.roll(form, shift=+1, axis=direction)``.
+        '''
+        index = np.arange(self.sites).reshape(self.dims)
+        return np.stack([np.roll(index, shift=+1, axis=a) for a in range(self.dim)]).reshape(self.dim, self.sites)
+
     @cached_property
     def checkerboarding(self):
         r'''
@@ -919,6 +1008,49 @@ class Lattice2D(ReadWriteable):
         '''
         return  self.fft( self.fft(f, axes=axes).conj() * self.fft(g, axes=axes), axes=axes) / np.sqrt(self.sites)
 
+    def autocorrelation(self, f, axes=(-2,-1)):
+        r'''
+        The `autocorrelation <https://en.wikipedia.org/wiki/Autocorrelation>`_ is the :func:`~.correlation` of a form with itself,
+
+        .. math ::
+            \texttt{autocorrelation(f)}(t, x) = (f ⋆ f)(t, x) = \frac{1}{N^2} \sum_{\tau y} f(\tau,y)^* f(\tau-t, y-x)
+
+        but only one forward transform is needed, since $F^*_{\nu,k} F_{\nu,k} = |F_{\nu,k}|^2$.
+
+        .. collapse :: When f is real the autocorrelation is real and needs only half the frequencies.
+            :class: note
+
+            If $f$ is real then $F_{-\nu,-k} = F^*_{\nu,k}$, so that $|F|^2$ is real and even, and the cross-correlation formula simplifies,
+
+            .. math ::
+
+               \begin{align}
+                \texttt{autocorrelation(f)} &= \texttt{fft(|fft(f)|^2)} / N = \texttt{ifft(|fft(f)|^2)} / N
+               \end{align}
+
+            which is real.  So, we can use numpy's `real-input transforms <https://numpy.org/doc/stable/reference/routines.fft.html#real-and-hermitian-transforms>`_
+            which skip the redundant (negative) frequencies along the last axis.
+
+        Parameters
+        ----------
+        f: np.array
+            A form whose axes are temporal and spatial directions.
+        axes: (int, int)
+            The temporal and spatial dimensions along which to correlate.
+
+        Returns
+        -------
+        np.array:
+            The correlation of f with itself along the axes, which represent the (time, space) separation.
+            Real if f is real, complex otherwise.
+        '''
+        if np.iscomplexobj(f):
+            F = self.fft(f, axes=axes)
+            return self.fft((F.conj() * F), axes=axes) / np.sqrt(self.sites)
+
+        F = np.fft.rfft2(f, axes=axes)
+        return np.fft.irfft2((F.conj() * F).real, s=tuple(f.shape[a] for a in axes), axes=axes) / self.sites
+
     def plot_form(self, p, form, axis, label=None, zorder=None,
                   cmap=None, cbar_kw=dict(), norm=colors.CenteredNorm(),
                   pointsize=200, linkwidth=0.025,
@@ -1061,7 +1193,7 @@ class Lattice2D(ReadWriteable):
         '''
 
         # These are computed lazily because the implementation of _point_group_permutations is quadratic.
-        return  np.stack(tuple(self._point_group_permutation(o) for o in self.point_group_operations))
+        return  np.stack([self._point_group_permutation(o) for o in self.point_group_operations])
 
     def _point_group_permutation(self, operator):
         # Since the operations map lattice points to lattice points we know that they are a permutation
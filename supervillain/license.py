@@ -1,12 +1,16 @@
 
+from functools import cache
 from pathlib import Path
 
 this = Path(__file__)
+root = this.parent.parent
 
+@cache
 def copyright():
-    with open(f"{this.parent.parent}/LICENSE","r") as l:
+    with open(root / "LICENSE", "r") as l:
         return l.read()
 
+@cache
 def license():
-    with open(f"{this.parent.parent}/LICENSES/GPL","r") as g:
+    with open(root / "LICENSES" / "GPL", "r") as g:
         return g.read()
@@ -2,14 +2,30 @@ from .observable import Observable, Scalar, Constrained
 from .observable import OnlyVillain, NotVillain, OnlyWorldline, NotWorldline
 from .derived import DerivedQuantity
 
-from .links import Links
+from .links import Links, LinksSquared
 from .energy import InternalEnergyDensity, InternalEnergyDensitySquared, InternalEnergyDensityVariance, SpecificHeatCapacity
 from .action import ActionDensity, ActionTwoPoint, Action_Action
 from .winding import WindingSquared, Winding_Winding
 from .wrapping import TorusWrapping, TWrapping, XWrapping
-from .spin import Spin_Spin, SpinSusceptibility, SpinSusceptibilityScaled
+from .spin import Spin, Spin_Spin, SpinSusceptibility, SpinSusceptibilityScaled
 from .vortex import Vortex_Vortex, VortexSusceptibility, VortexSusceptibilityScaled
 
+# Every observable module must be imported eagerly: importing an Observable's module is what registers it
+# and attaches it to the Ensemble, so lazily importing them would hide observables from Ensemble.measure.
+__all__ = [
+    'Observable', 'Scalar', 'Constrained',
+    'OnlyVillain', 'NotVillain', 'OnlyWorldline', 'NotWorldline',
+    'DerivedQuantity',
+    'Links', 'LinksSquared',
+    'InternalEnergyDensity', 'InternalEnergyDensitySquared', 'InternalEnergyDensityVariance', 'SpecificHeatCapacity',
+    'ActionDensity', 'ActionTwoPoint', 'Action_Action',
+    'WindingSquared', 'Winding_Winding',
+    'TorusWrapping', 'TWrapping', 'XWrapping',
+    'Spin', 'Spin_Spin', 'SpinSusceptibility', 'SpinSusceptibilityScaled',
+    'Vortex_Vortex', 'VortexSusceptibility', 'VortexSusceptibilityScaled',
+    'progress',
+]
+
 def progress(iterable, **kwargs):
     r'''
     Like `tqdm <https://tqdm.github.io/docs/tqdm/#tqdm-objects>`_, but requires the iterable.
@@ -1,7 +1,7 @@
 from supervillain.observable import Scalar, Observable, DerivedQuantity
 import numpy as np
 
-class ActionDensity(Scalar, Observable):
+class ActionDensity(Scalar, Observable, vectorized=True):
     r'''The expectation value of the action density can be calculated as
 
     .. math::
@@ -22,17 +22,18 @@ class ActionDensity(Scalar, Observable):
     '''
 
     @staticmethod
-    def Villain(S, phi, n):
+    def Villain(S, _LinksSquaredSum):
         r'''
         In the :class:`~.Villain` case differentiating and then multiplying by $\kappa$ gives the action $S_0$ itself!
         '''
 
         L = S.Lattice
-        return S(phi, n) / (L.sites)
+        # S_0 = κ/2 ∑_ℓ (dφ - 2πn)^2, computed for every configuration at once.
+        return 0.5 * S.kappa * _LinksSquaredSum / L.sites
 
 
     @staticmethod
-    def Worldline(S, Links):
+    def Worldline(S, _LinksSquaredSum):
         r'''
         In the :class:`~.Worldline` formulation we differentiate to find
 
@@ -44,9 +45,9 @@ class ActionDensity(Scalar, Observable):
         '''
         
         L = S.Lattice
-        return (L.links / 2 - 0.5 / S.kappa * (Links**2).sum()) / (L.sites)
+        return (L.links / 2 - 0.5 / S.kappa * _LinksSquaredSum) / (L.sites)
 
-class ActionTwoPoint(Observable):
+class ActionTwoPoint(Observable, vectorized=True):
     r'''
     In :class:`~.Action_Action` we need the translation-averaged
 
@@ -62,7 +63,7 @@ class ActionTwoPoint(Observable):
     '''
 
     @staticmethod
-    def Villain(S, Links):
+    def Villain(S, LinksSquared):
         r'''
         In the :class:`~.Villain` formulation one finds
 
@@ -87,21 +88,24 @@ class ActionTwoPoint(Observable):
         '''
         
         L = S.Lattice
-        density = 0.5 * S.kappa * (Links**2).sum(axis=0)
+        # ActionTwoPoint is vectorized, so LinksSquared carries a leading configuration axis
+        # and the (time, space) axes are always the last two.
+        density = 0.5 * S.kappa * LinksSquared
 
-        result = L.correlation(density, density)
+        # The density is real, so its autocorrelation is too and we can skip half of the FFT.
+        result = L.autocorrelation(density)
 
         # The averaging over x of the δ term just modifies Δx=0.
         # We can simplify 1/Λ ∑_x δ_{x,x-Δx} f_x = δ_{Δx, 0} 1/Λ ∑_x f_x which means the Δx=0
         # piece of the correlator needs adjustment by the average f.
         # In this case f = density.
 
-        result[0,0] -= density.mean()
+        result[..., 0, 0] -= density.mean(axis=(-2, -1))
 
         return result
 
     @staticmethod
-    def Worldline(S, Links):
+    def Worldline(S, LinksSquared):
         r'''
         In the :class:`~.Worldline` formulation one has to carefully treat the $|\ell|/2 \log 2\pi \kappa$ contribution.
         We should really imagine $|\ell|/2$ as arising from a sum over sites of independent $\log 2\pi \kappa$s.
@@ -133,11 +137,14 @@ class ActionTwoPoint(Observable):
         
         L = S.Lattice
         kappa = S.kappa
-        m_squared = (Links**2).sum(axis=0)
 
-        derivative = 1 -0.5 / kappa * m_squared
+        # The same (m-δv/W)^2 / 2κ appears in the derivative and in the δ term below,
+        # so we compute it once from the shared LinksSquared.
+        delta = 0.5 / kappa * LinksSquared
 
-        result = L.correlation(derivative, derivative)
+        derivative = 1 - delta
+
+        result = L.autocorrelation(derivative)
 
         # The averaging over x of the δ terms just modifies Δx=0.
         # We can simplify 1/Λ ∑_x δ_{x,x-Δx} f_x = δ_{Δx, 0} 1/Λ ∑_x f_x which means the Δx=0
@@ -145,13 +152,11 @@ class ActionTwoPoint(Observable):
         # In this case f = (m-δv/W)^2 / 2κ,
         # what is left from cancelling the local one-derivative against the two-derivative term.
 
-        delta = m_squared / 2 / kappa
-
-        result[0,0] -= delta.mean()
+        result[..., 0, 0] -= delta.mean(axis=(-2, -1))
 
         return result
 
-class Action_Action(DerivedQuantity):
+class Action_Action(DerivedQuantity, vectorized=True):
     r'''
     If we imagine rewriting the actions' sums over links as a sum over sites and a sum over directions we can associate a value of κ with each site.
     Then we may compute the correlations of the action density by evaluating
@@ -212,4 +217,6 @@ class Action_Action(DerivedQuantity):
 
     @staticmethod
     def default(S, ActionTwoPoint, ActionDensity):
-        return ActionTwoPoint - ActionDensity**2
+        # The ActionDensity needs trailing axes to broadcast against the spacetime
+        # axes of ActionTwoPoint when evaluated on many bootstrap draws at once.
+        return ActionTwoPoint - np.expand_dims(ActionDensity**2, (-2, -1))
@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 
 import numpy as np
-from functools import partial
 import inspect
 
 import supervillain.analysis
@@ -12,11 +11,23 @@ logger = logging.getLogger(__name__)
 
 class DerivedQuantity:
 
-    def __init_subclass__(cls, intermediate=False):
+    def __init_subclass__(cls, intermediate=False, vectorized=False):
         # This registers every subclass that inherits from DerivedQuantity.
         # Upon registration, Bootstrap gets an attribute with the appropriate name.
+        #
+        # A DQ whose implementations broadcast correctly over a leading bootstrap axis
+        # may declare itself vectorized=True, in which case it is evaluated once on all
+        # the draws together, rather than draw by draw.
 
         name = cls.__name__
+        cls._vectorized = vectorized
+        # Which other quantities each implementation needs is fixed, so we inspect every signature once, here.
+        # All implementations must take the action as the first argument; the rest name what they depend on.
+        cls._arguments = {
+            implementation: tuple(inspect.signature(getattr(cls, implementation)).parameters)[1:]
+            for implementation in dir(cls)
+            if isinstance(inspect.getattr_static(cls, implementation), staticmethod)
+        }
 
         cls._logger = (logger.debug if name[0] == '_' else logger.info)
         cls._debug  = logger.debug
@@ -38,37 +49,41 @@ class DerivedQuantity:
             return obj.__dict__[name]
 
         # Just call the measurement and cache the result.
-        class_name = obj.Ensemble.Action.__class__.__name__
+        action = obj.Ensemble.Action
+        class_name = action.__class__.__name__
+
+        # DQs can have action-dependent implementations
+        # and a fall-back default which is convenient when dqs depend
+        # depend simply on observables or other dqs.  For example, a global
+        # charge might just sum up a density, regardless of formulation.
+        if class_name in self._arguments:
+            implementation = class_name
+        elif 'default' in self._arguments:
+            implementation = 'default'
+        else:
+            raise NotImplementedError(f'Needs an implementation of {name} for {class_name} action.')
+        measure = getattr(self, implementation)
+
+        # DQs can depend on other DQs and expectation values of Observables.
+        # We look up the arguments as attributes of the bootstrap.
+        # Since primary Observables are automatically bootstrapped by the Bootstrap
+        # object, at this point the loop is over expectation values.
+        # Only a missing implementation or a missing dependency means the DQ is not implemented;
+        # errors raised while evaluating the implementation itself propagate unchanged.
         try:
-            # DQs can have action-dependent implementations
-            # and a fall-back default which is convenient when dqs depend
-            # depend simply on observables or other dqs.  For example, a global
-            # charge might just sum up a density, regardless of formulation.
-            try:
-                measure = getattr(self, class_name)
-            except AttributeError as e:
-                if hasattr(self, 'default'):
-                    measure = getattr(self, 'default')
-                else:
-                    raise e from None
-            
-            # All dqs must take the action as the first argument.
-            measure = partial(measure, obj.Ensemble.Action)
+            expectations = [getattr(obj, o) for o in self._arguments[implementation]]
+        except AttributeError as e:
+            raise NotImplementedError(f'{name} for {class_name} action needs {self._arguments[implementation]}.') from e
 
-            # DQs can depend on other DQs and expectation values of Observables.
-            # We look up the arguments as attributes of the bootstrap.
-            # Since primary Observables are automatically bootstrapped by the Bootstrap
-            # object, at this point the loop is over expectation values.
-            with Timer(self._logger, f'Bootstrapping of {name}', per=len(obj)):
+        with Timer(self._logger, f'Bootstrapping of {name}', per=len(obj)):
+            if self._vectorized:
+                obj.__dict__[name] = np.asarray(measure(action, *expectations))
+            else:
                 obj.__dict__[name]= np.array([
-                    measure(*expectation)
-                    for expectation in zip(*[getattr(obj, o) for o in inspect.getfullargspec(measure).args])
+                    measure(action, *expectation)
+                    for expectation in zip(*expectations)
                 ])
-            return obj.__dict__[name]
-        except:
-            raise NotImplementedError(f'Needs an implementation of {name} for {class_name} action.')
-
-        raise NotImplementedError()
+        return obj.__dict__[name]
 
     def __set__(self, obj, value):
         setattr(obj, self.name, value)
@@ -1,7 +1,7 @@
 from supervillain.observable import Scalar, Observable, DerivedQuantity
 import numpy as np
 
-class InternalEnergyDensity(Scalar, Observable):
+class InternalEnergyDensity(Scalar, Observable, vectorized=True):
     r'''If we think of $\kappa$ like a thermodynamic $\beta$, then we may compute the internal energy $U$
 
     .. math::
@@ -22,16 +22,17 @@ class InternalEnergyDensity(Scalar, Observable):
     '''
 
     @staticmethod
-    def Villain(S, phi, n):
+    def Villain(S, _LinksSquaredSum):
         r'''
         In the :class:`~.Villain` case differentiating the action $S_0$ is the same as dividing it by $\kappa$!
         '''
         L = S.Lattice
-        return S(phi, n) / (L.sites * S.kappa)
+        # S_0 / κ = 1/2 ∑_ℓ (dφ - 2πn)^2, computed for every configuration at once.
+        return 0.5 * _LinksSquaredSum / L.sites
 
 
     @staticmethod
-    def Worldline(S, Links):
+    def Worldline(S, _LinksSquaredSum):
         r'''
         In the :class:`~.Worldline` formulation we differentiate to find
 
@@ -43,9 +44,9 @@ class InternalEnergyDensity(Scalar, Observable):
         '''
 
         L = S.Lattice
-        return (L.links / 2 - 0.5 / S.kappa * (Links**2).sum()) / (L.sites * S.kappa)
+        return (L.links / 2 - 0.5 / S.kappa * _LinksSquaredSum) / (L.sites * S.kappa)
 
-class InternalEnergyDensitySquared(Scalar, Observable):
+class InternalEnergyDensitySquared(Scalar, Observable, vectorized=True):
     r'''
     If we think of $\kappa$ as a thermodynamic $\beta$, then we
     may compute the expectation value of the square of the internal
@@ -65,7 +66,7 @@ class InternalEnergyDensitySquared(Scalar, Observable):
     '''
 
     @staticmethod
-    def Villain(S, phi, n):
+    def Villain(S, _LinksSquaredSum):
         r'''
         In the :class:`~.Villain` case,
 
@@ -78,11 +79,11 @@ class InternalEnergyDensitySquared(Scalar, Observable):
         '''
 
         L = S.Lattice
-        return (S(phi, n) / (L.sites * S.kappa))**2
+        return (0.5 * _LinksSquaredSum / L.sites)**2
 
 
     @staticmethod
-    def Worldline(S, Links):
+    def Worldline(S, _LinksSquaredSum):
         r'''
         In the :class:`~.Worldline` formulation we differentiate to find
 
@@ -96,12 +97,12 @@ class InternalEnergyDensitySquared(Scalar, Observable):
         '''
 
         L = S.Lattice
-        partial_kappa_S = (L.links / 2 - 0.5 / S.kappa * (Links**2).sum()) / S.kappa
-        partial_2_kappa_S = ((Links**2).sum() / S.kappa - L.links / 2) / S.kappa**2
+        partial_kappa_S = (L.links / 2 - 0.5 / S.kappa * _LinksSquaredSum) / S.kappa
+        partial_2_kappa_S = (_LinksSquaredSum / S.kappa - L.links / 2) / S.kappa**2
         
         return (partial_kappa_S**2 - partial_2_kappa_S) / L.sites**2
 
-class InternalEnergyDensityVariance(DerivedQuantity):
+class InternalEnergyDensityVariance(DerivedQuantity, vectorized=True):
     r'''
     .. math ::
         
@@ -117,7 +118,7 @@ class InternalEnergyDensityVariance(DerivedQuantity):
     def default(S, InternalEnergyDensitySquared, InternalEnergyDensity):
         return InternalEnergyDensitySquared - InternalEnergyDensity**2
 
-class SpecificHeatCapacity(DerivedQuantity):
+class SpecificHeatCapacity(DerivedQuantity, vectorized=True):
     r'''
     The (intensive) specific heat capacity $c$ is given by
 
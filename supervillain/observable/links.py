@@ -1,7 +1,7 @@
 from supervillain.observable import Observable
 import numpy as np
 
-class Links(Observable):
+class Links(Observable, vectorized=True):
     r'''
     Both the :class:`~.Villain` and :class:`~.Worldline` formulations have the notion of invariant links.
     The main purpose of ``Links`` is to ensure that we always write functions of the correct combination of raw fields.
@@ -28,7 +28,13 @@ class Links(Observable):
         '''
 
         L = S.Lattice
-        return L.d(0, phi) - 2*np.pi*n
+        # Links is vectorized, so phi and n carry a leading configuration axis, which d broadcasts over.
+        # d(0, phi) is freshly allocated, so we can subtract in place and skip one temporary.
+        # When no n is nonzero there is nothing to subtract at all.
+        links = L.d(0, phi)
+        if n.any():
+            links -= 2*np.pi*n
+        return links
 
     @staticmethod
 
@@ -43,4 +49,34 @@ class Links(Observable):
         '''
 
         L = S.Lattice
-        return m - L.delta(2, v) / S.W
+        # When v vanishes identically there is no need to compute δv at all.
+        links = m.astype(float)
+        if v.any():
+            links -= L.delta(2, v) / S.W
+        return links
+
+class LinksSquared(Observable, vectorized=True):
+    r'''
+    Many observables, like the :class:`~.ActionDensity`, the :class:`~.InternalEnergyDensity`, and the :class:`~.ActionTwoPoint`, only need the
+    square of the :class:`~.Links` summed over the links that start at each site,
+
+    .. math ::
+        \texttt{LinksSquared}_x = \sum_{\ell \text{ from } x} \texttt{Links}_\ell^2,
+
+    which is a 0-form.  Since it is an observable it is computed once, for every configuration together, and shared by all of them.
+    '''
+
+    @staticmethod
+    def default(S, Links):
+        # Contracting the direction index squares and sums in one pass, for every configuration at once.
+        return np.einsum('...dtx,...dtx->...tx', Links, Links)
+
+class _LinksSquaredSum(Observable, vectorized=True):
+    r'''
+    The sum of :class:`~.LinksSquared` over the whole lattice, $\sum_\ell \texttt{Links}_\ell^2$, which is all that the
+    :class:`~.ActionDensity`, :class:`~.InternalEnergyDensity`, and :class:`~.InternalEnergyDensitySquared` need.
+    '''
+
+    @staticmethod
+    def default(S, LinksSquared):
+        return LinksSquared.sum(axis=(-2, -1))
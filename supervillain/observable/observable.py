@@ -1,8 +1,10 @@
 #!/usr/bin/env python
 
-from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 import inspect
 
+import numpy as np
+
 import supervillain.action
 import supervillain.ensemble
 from supervillain.performance import Timer
@@ -14,13 +16,57 @@ from tqdm.contrib.logging import logging_redirect_tqdm
 
 registry=dict()
 
+def _stack(measurements, count):
+    # Like np.array(list(measurements)) but without holding every measurement in a list and then copying them all;
+    # instead we allocate once we know the shape and type of one measurement and fill in place.
+    #
+    # If a later measurement needs a wider type (a complex number after real ones, say) assigning it would silently cast,
+    # so instead we fall back to np.array on everything, which promotes.
+    measurements = iter(measurements)
+    try:
+        first = next(measurements)
+    except StopIteration:
+        return np.array([])
+
+    dtype = np.result_type(first)
+    result = np.empty((count,) + np.shape(first), dtype=dtype)
+    result[0] = first
+    for i, measurement in enumerate(measurements, start=1):
+        if np.result_type(measurement) != dtype:
+            return np.array(list(result[:i]) + [measurement] + list(measurements))
+        result[i] = measurement
+
+    return result
+
 class Observable:
 
-    def __init_subclass__(cls, intermediate=False):
+    def __init_subclass__(cls, intermediate=False, parallel=False, vectorized=False):
         # This registers every subclass that inherits from Observable.
         # Upon registration, Ensemble gets an attribute with the appropriate name.
+        #
+        # Observables whose measurements are dominated by numpy work that releases the GIL
+        # (FFTs, for example) and which keep no state between configurations may declare
+        # themselves parallel=True so that configurations are measured in a thread pool.
+        #
+        # Observables whose implementations broadcast correctly over a leading configuration axis
+        # may instead declare vectorized=True so that all configurations are measured in one call.
+        # If only some implementations broadcast, vectorized may instead name them, as in vectorized=('Villain',).
 
         name = cls.__name__
+        cls._parallel = parallel
+        # Which fields and observables each implementation needs is fixed, so we inspect every signature once, here.
+        # All implementations must take the action as the first argument; the rest name what they depend on.
+        cls._arguments = {
+            implementation: tuple(inspect.signature(getattr(cls, implementation)).parameters)[1:]
+            for implementation in dir(cls)
+            if isinstance(inspect.getattr_static(cls, implementation), staticmethod)
+        }
+        if vectorized is True:
+            cls._vectorized = frozenset(cls._arguments)
+        elif vectorized is False:
+            cls._vectorized = frozenset()
+        else:
+            cls._vectorized = frozenset(vectorized)
 
         registry[name] = cls
 
@@ -44,38 +90,49 @@ class Observable:
             return obj.__dict__[name]
 
         # Just call the measurement and cache the result.
-        class_name = obj.Action.__class__.__name__
-        try:
-            # Observables can have action-dependent implementations
-            # and a fall-back default which is convenient for observables which
-            # depend simply on others.  For example, a density might not
-            # need the field variables but the global charge (or vice-versa).
-            try:
-                measure = getattr(self, class_name)
-            except AttributeError as e:
-                if hasattr(self, 'default'):
-                    measure = getattr(self, 'default')
-                else:
-                    raise e from None
-
-            # All observables must take the action as the first argument.
-            measure = partial(measure, obj.Action)
+        action = obj.Action
+        class_name = action.__class__.__name__
+
+        # Observables can have action-dependent implementations
+        # and a fall-back default which is convenient for observables which
+        # depend simply on others.  For example, a density might not
+        # need the field variables but the global charge (or vice-versa).
+        if class_name in self._arguments:
+            implementation = class_name
+        elif 'default' in self._arguments:
+            implementation = 'default'
+        else:
+            raise NotImplementedError(f'{name} not implemented for {class_name}')
+
+        # All observables must take the action as the first argument.
+        measure = getattr(self, implementation)
+        arguments = self._arguments[implementation]
 
+        try:
             # Observables can depend on field variables and other Observables.
             # We look up the arguments as attributes of the ensemble.
-            with Timer(self._logger, f'Measurement of {name}', per=len(obj)):
-                with logging_redirect_tqdm():
-                    obj.__dict__[name]= supervillain.h5.extendable.array([
-                        measure(*obs)
-                        for obs in supervillain.observable.progress(
-                            zip(*[getattr(obj, o) for o in inspect.getfullargspec(measure).args]),
-                            desc=f'{name:{max([len(k) for k in registry])}s}', leave=True, total=len(obj))
-                        ])
-            return obj.__dict__[name]
-        except Exception as exception:
+            # Only a missing argument means the observable is unavailable;
+            # any error raised by the measurement itself is a genuine failure and should propagate.
+            values = [getattr(obj, o) for o in arguments]
+        except AttributeError as exception:
             raise NotImplementedError(f'{name} not implemented for {class_name}') from exception
 
-        raise NotImplementedError()
+        with Timer(self._logger, f'Measurement of {name}', per=len(obj)):
+            if implementation in self._vectorized:
+                obj.__dict__[name] = supervillain.h5.extendable.array(measure(action, *values))
+                return obj.__dict__[name]
+
+            with logging_redirect_tqdm():
+                configurations = supervillain.observable.progress(
+                        zip(*values),
+                        desc=f'{name:{max([len(k) for k in registry])}s}', leave=True, total=len(obj))
+                if self._parallel:
+                    with ThreadPoolExecutor() as pool:
+                        measurements = _stack(pool.map(lambda obs: measure(action, *obs), configurations), len(obj))
+                else:
+                    measurements = _stack((measure(action, *obs) for obs in configurations), len(obj))
+                obj.__dict__[name]= supervillain.h5.extendable.array(measurements)
+        return obj.__dict__[name]
 
     def __set__(self, obj, value):
         obj.__dict__[self.__class__.__name__] = value
@@ -1,7 +1,11 @@
+from functools import lru_cache
+from itertools import product
+
 import numpy as np
+from supervillain.lattice import _dimension
 from supervillain.observable import Observable
 
-class Spin_SpinSloppy(Observable):
+class Spin_SpinSloppy(Observable, vectorized=('Villain',)):
     r'''
 
     This performs the same measurement as the non-Sloppy version but does not get all the juice out of every Worldline configuration.
@@ -11,16 +15,14 @@ class Spin_SpinSloppy(Observable):
     '''
 
     @staticmethod
-    def Villain(S, phi):
+    def Villain(S, Spin):
         r'''
         The same as in the :class:`~.Spin_Spin`.
         '''
 
         L = S.Lattice
 
-        exp_i_phi = np.exp(1.j * phi)
-
-        return L.correlation(exp_i_phi, exp_i_phi)
+        return L.autocorrelation(Spin)
 
     @staticmethod
     def Worldline(S, Links):
@@ -30,40 +32,44 @@ class Spin_SpinSloppy(Observable):
         '''
 
         L = S.Lattice
-        kappa = S.kappa
+        # As in Spin_Spin, a path of length ℓ and overlap o with the configuration is weighted by exp(-(2o+ℓ)/2κ).
+        weight = -1/(2*S.kappa)
 
-        result = L.linearize(L.form(0))
+        # Negative displacements index from the end, which is exactly where the coordinatized form keeps them,
+        # so we can fill the form directly without linearizing it first.
+        result = L.form(0)
 
         # For every displacment we will take the taxicab route, as dumb as possible.
         # Just go Δt in time first and then Δx in space.
-        for i, (Δt, Δx)  in enumerate(L.coordinates):
-            P = L.form(1)
+        #
+        # The stencil P is ±1 on the links of the path and 0 elsewhere, so rather than building it
+        # we can sum P (2 Links + P) = 2 P Links + P^2 along the path directly;
+        # P^2 just counts the |Δt| + |Δx| links on the path.
+        for Δt, Δx in L.coordinates:
 
             if Δt >= 0:
                 # Follow the links in the positive t direction.
-                # Therefore increment P by 1
-                P[0][:Δt,0] = +1
+                t_path = +Links[0][:Δt,0].sum()
             else:
                 # Follow the links in the negative t direction.
-                # Therefore decrement P by 1
-                P[0][Δt:,0] = -1
+                t_path = -Links[0][Δt:,0].sum()
 
             if Δx >= 0:
                 # Follow the links in the positive x direction.
-                P[1][Δt,:Δx] = +1
+                x_path = +Links[1][Δt,:Δx].sum()
             else:
                 # Follow the links in the negative x direction.
-                P[1][Δt,Δx:] = -1
+                x_path = -Links[1][Δt,Δx:].sum()
 
             # The difference between the Sloppy and full versions is that here we only
-            # overlay the stencil on the configuration one time.  That always puts the
+            # overlay the path on the configuration one time.  That always puts the
             # defect at the absolute origin and (Δt, Δx), as opposed to summing over all
             # the possible origins.
-            result[i] += np.exp(-1/(2*kappa) * (P* (2*Links + P)).sum())
+            result[Δt, Δx] += np.exp(weight * (2*(t_path + x_path) + abs(Δt) + abs(Δx)))
 
-        return L.coordinatize(result)
+        return result
 
-class Spin_SpinSlow(Observable):
+class Spin_SpinSlow(Observable, vectorized=('Villain',)):
     r'''
 
     We can deform $Z_J \rightarrow Z_{J}[x,y]$ to include the creation of a boson at $y$ and the destruction of a boson at $x$ in the action.
@@ -85,20 +91,16 @@ class Spin_SpinSlow(Observable):
 '''
 
     @staticmethod
-    def Villain(S, phi):
+    def Villain(S, Spin):
         r'''
         The same as in  :class:`~.Spin_Spin`.
         '''
 
         L = S.Lattice
 
-        exp_i_phi = np.exp(1.j * phi)
-
-        return L.correlation(exp_i_phi, exp_i_phi)
+        return L.autocorrelation(Spin)
 
 
-    _stencils = dict()
-
     @staticmethod
     def Worldline(S, Links):
         r'''
@@ -111,58 +113,63 @@ class Spin_SpinSlow(Observable):
         # observable.
 
         L = S.Lattice
-        kappa = S.kappa
+        # The same path weight as in Spin_SpinSloppy.
+        weight = -1/(2*S.kappa)
+
+        # As in Spin_SpinSloppy, negative displacements index the coordinatized form from the end.
+        result = L.form(0)
 
-        result = L.linearize(L.form(0))
+        # Tiling the configuration twice in each direction means that every translation of the links
+        # is a contiguous window rather than a wrapped-around copy.
+        windows = np.lib.stride_tricks.sliding_window_view(np.tile(Links, (1, 2, 2)), (L.nt, L.nx), axis=(1, 2))
 
         # For every displacment we will take the taxicab route, as dumb as possible.
         # Just go Δt in time first and then Δx in space.
-        for i, (Δt, Δx)  in enumerate(L.coordinates):
-            try:
-                P = Spin_SpinSlow._stencils[(L.nt, L.nx, Δt, Δx)]
-            except KeyError:
-                # Each stencil will hold the path starting on the origin, AND a copy
-                # for every other starting point.
-                #
-                # We construct the one from the origin first, as it is easiest to think about...
-                P = L.form(1, L.sites)
-
-                if Δt >= 0:
-                    # Follow the links in the positive t direction.
-                    # Therefore increment P by 1
-                    P[0, 0][:Δt,0] = +1
-                else:
-                    # Follow the links in the negative t direction.
-                    # Therefore decrement P by 1
-                    P[0, 0][Δt:,0] = -1
-
-                if Δx >= 0:
-                    # Follow the links in the positive x direction.
-                    P[0, 1][Δt,:Δx] = +1
-                else:
-                    # Follow the links in the negative x direction.
-                    P[0, 1][Δt,Δx:] = -1
-
-                # ... and then we just roll it around and store every possible translation.
-                for j, shift in enumerate(L.coordinates):
-                    P[j] = L.roll(P[0], shift)
-
-                Spin_SpinSlow._stencils[(L.nt, L.nx, Δt, Δx)] = P
-
-            # In the full measurement we overlay the stencil on the configuration 
+        for (Δt, Δx), (support, signs) in zip(L.coordinates, _taxicab_stencils(L.nt, L.nx)):
+            # In the full measurement we overlay the stencil on the configuration
             # in all possible ways and sum.  Then we have measured the dependence on Δx
             # as efficiently as possible for each configuration, summing each displacement
             # over all possible starting points.
             #
-            # Since we have stored every translation, we can use the numpy broadcasting rules
-            #
-            #    https://numpy.org/doc/stable/user/basics.broadcasting.html
-            #
-            # to eliminate some python for loops, which were explicit in previous implementations.
-            result[i] = np.exp(-1/(2*kappa) * (P * (2*Links + P)).sum(
-                axis=(1,2,3)    # the 0th axis is the broadcast axis, 1,2, and 3 are the vector index, time, and space.
-                )).mean()       # <-- we should average over the different starting points.
-
-        return L.coordinatize(result)
-
-
+            # Rather than translating the stencil we translate the configuration the opposite way;
+            # the window starting at each link on the path gives that link's contribution for every starting point at once.
+            # Away from the path P vanishes, and on it P (2 Links + P) = 2 P Links + 1,
+            # so the overlap is a single matrix-vector product of the signs against the gathered windows.
+            overlap = signs @ windows[support].reshape(len(signs), L.sites)
+            result[Δt, Δx] = np.exp(weight * (2*overlap + len(signs))).mean() # <-- we should average over the different starting points.
+
+        return result
+
+@lru_cache(maxsize=4)
+def _taxicab_stencils(nt, nx):
+    # The stencils only depend on the lattice size, so we build them once for every displacement,
+    # in the same order as L.coordinates.  Only the few most recently used sizes are kept.
+    stencils = []
+    for Δt, Δx in product(_dimension(nt), _dimension(nx)):
+        # The stencil holds the path starting on the origin.
+        # Its entries are only ever 0 or ±1, so there is no need to store them as floats.
+        P = np.zeros((2, nt, nx), dtype=np.int8)
+
+        if Δt >= 0:
+            # Follow the links in the positive t direction.
+            # Therefore increment P by 1
+            P[0][:Δt,0] = +1
+        else:
+            # Follow the links in the negative t direction.
+            # Therefore decrement P by 1
+            P[0][Δt:,0] = -1
+
+        if Δx >= 0:
+            # Follow the links in the positive x direction.
+            P[1][Δt,:Δx] = +1
+        else:
+            # Follow the links in the negative x direction.
+            P[1][Δt,Δx:] = -1
+
+        # Storing every translation of the whole stencil would take a volume's worth of memory
+        # for every starting point and every displacement.  Instead we only keep the links on the path,
+        # where P is nonzero, and their signs.
+        support = np.nonzero(P)
+        stencils.append((support, P[support]))
+
+    return tuple(stencils)
@@ -2,7 +2,22 @@ import numpy as np
 from supervillain.observable import Scalar, Observable
 import supervillain.action
 
-class Spin_Spin(Observable):
+class Spin(Observable, vectorized=True):
+    r'''
+    In the :class:`~.Villain` formulation the local spin operator is simply
+
+    .. math ::
+        \texttt{Spin}_x = e^{i\phi_x}
+
+    which is what the :class:`~.Spin_Spin` correlator correlates.  Since it is an observable it is computed once per configuration and shared.
+    The :class:`~.Worldline` formulation has no local spin operator; see :class:`~.Spin_Spin` for how the correlator is measured there instead.
+    '''
+
+    @staticmethod
+    def Villain(S, phi):
+        return np.exp(1.j * phi)
+
+class Spin_Spin(Observable, vectorized=('Villain',), parallel=True):
     r'''
 
     We can deform $Z_J \rightarrow Z_{J}[x,y]$ to include the creation of a boson at $y$ and the destruction of a boson at $x$ in the action.
@@ -25,7 +40,7 @@ class Spin_Spin(Observable):
     '''
 
     @staticmethod
-    def Villain(S, phi):
+    def Villain(S, Spin):
         r'''
         In the :class:`~.Villain` formulation the correlator is just
 
@@ -37,14 +52,7 @@ class Spin_Spin(Observable):
 
         L = S.Lattice
 
-        spin = np.exp(1.j * phi)
-
-        return L.correlation(spin, spin)
-
-    _signs = dict()
-    _directions = dict()
-    _coordinates = dict()
-
+        return L.autocorrelation(Spin)
 
     @staticmethod
     def Worldline(S, Links):
@@ -92,13 +100,15 @@ class Spin_Spin(Observable):
         # Note: for a substantially similar but slower implementation see the Spin_SpinSlow observable.
 
         L = S.Lattice
-        kappa = S.kappa
+        # Every path of length ℓ and overlap o with the configuration is weighted by exp(-(2o+ℓ)/2κ).
+        weight = -1/(2*S.kappa)
 
         result = L.form(0)
 
         # For every displacment we will take the taxicab route, as dumb as possible.
-        # In Spin_SpinSlow we create stencils that are 0 and ±1, one value for every link.
+        # The obvious approach is to create stencils that are 0 and ±1, one value for every link.
         # Then we multiply m by the stencil, which selects links on the taxicab route, and sum.
+        # (Spin_SpinSlow builds exactly those stencils, though it only keeps their nonzero links.)
         #
         # That's a perfectly correct algorithm, but the issue is there is a lot of wasted effort.
         # For every displacement we have to do a whole volume's worth of multiplications, while
@@ -106,107 +116,58 @@ class Spin_Spin(Observable):
         # In fact, the amount of waste is like L^2 while the amount of true work is L.  So the waste
         # is bad enough that we worsen the scaling of the algorithm.
         #
-        # Instead, let's just take the links we need and evaluate ΔS.
+        # Even just taking the links we need costs L per path.  But the taxicab route goes Δt in time
+        # first and then Δx in space, and a sum along a straight line is a difference of cumulative sums.
+        # So, once we accumulate the links along each axis, every path costs two subtractions no matter how long it is.
         #
-        # Just go Δt in time first and then Δx in space.
-        for i, (Δt, Δx)  in enumerate(L.coordinates):
-            if (Δt, Δx) == (0, 0):
-                result[0,0] = 1
-                continue
-
-            key = (L.nt, L.nx, Δt, Δx)
-            T = np.abs(Δt)
-            X = np.abs(Δx)
-            length = T+X
-
-             # The main idea is that the change in action on an included link needs
-            # a sign (depending on the orientation the link is traced), 
-            # the coordinates where the link is stored, and
-            # the direction the link is pointing.
-           
-            try:
-                # We can use the precomputed path if we have it.
-                sign = Spin_Spin._signs[key]
-                coordinates = Spin_Spin._coordinates[key]
-                direction = Spin_Spin._directions[key]
-            except KeyError:
-                # Otherwise we need to figure it out.
-                # The sign and direction are both 1 number per included link.
-                # The coordinates are two because we are two dimensions.
-                sign = np.zeros(length, dtype=int)
-                direction = np.zeros(length, dtype=int)
-                coordinates = np.zeros((length, L.dim), dtype=int)
-                
-                if Δt > 0:
-                    # If we trace along a link it counts towards ΔS.
-                    sign[:Δt] = +1
-                    # For the taxicab route we go in time first.
-                    direction[:Δt] = 0
-                    # The first steps are just sequential steps in time along the x-axis.
-                    coordinates[:Δt, 0] = np.arange(Δt)
-                    # The the remaining steps don't change the time at all.
-                    coordinates[Δt:, 0] = Δt
-                elif Δt < 0:
-                    # If we trace against a link it counts against ΔS.
-                    direction[:-Δt] = 0
-                    # For the taxicab route we go in time first.
-                    coordinates[:-Δt, 0] = np.arange(-1,Δt-1,-1)
-                    # The first steps are just sequential steps in time along the x-axis.
-                    coordinates[-Δt:, 0] = Δt
-                    # The the remaining steps don't change the time at all.
-                    sign[:-Δt] = -1
-                
-                if Δx > 0:
-                    # If we trace along a link it counts towards ΔS.
-                    sign[T:] = +1
-                    # After all the temporal steps we take spatial steps.
-                    direction[T:] = 1
-                    # The spatial steps are just off of the t-axis.
-                    coordinates[T:, 1] = np.arange(Δx)
-                elif Δx < 0:
-                    # If we trace a against link it counts against ΔS.
-                    sign[T:] = -1
-                    # After all the temporal steps we take spatial steps.
-                    direction[T:] = 1
-                    # The spatial steps are just off of the t-axis.
-                    coordinates[T:, 1] = np.arange(-1,Δx-1,-1)
-
-                # Now something a bit tricky.  We want to average over all possible starting locations.
-                # We can do that by adding to the coordinates of the path every starting location in L.coordinates
-                # and then modding back into the lattice.
-                #
-                # To avoid writing a python for loop, however, we manually broadcast.
-                coordinates = L.mod(np.broadcast_to(coordinates, (L.sites,length, L.dim)).transpose((1,0,2)) + L.coordinates).T
-                # The directions don't change but will be broadcast together in the indexing into m.
-                direction  = np.broadcast_to(direction, (L.sites, length))
-
-                Spin_Spin._signs[key] = sign
-                Spin_Spin._directions[key] = direction
-                Spin_Spin._coordinates[key] = coordinates
+        # We tile the links three times along the direction they point so that every start (in the middle copy)
+        # plus every displacement (at most half the lattice either way) lands inside the cumulative sum without wrapping.
+        # The leading 0 makes the difference of cumulative sums from a to b the sum over [a, b).
+        t_sums = np.zeros((3*L.nt+1, L.nx))
+        np.cumsum(np.tile(Links[0], (3, 1)), axis=0, out=t_sums[1:])
+        x_sums = np.zeros((L.nt, 3*L.nx+1))
+        np.cumsum(np.tile(Links[1], (1, 3)), axis=1, out=x_sums[:, 1:])
+
+        # The spatial leg of a path depends only on the time it starts at, its starting x, and Δx,
+        # so we can compute every one of them up front, once, as x_legs[t, Δx, x].
+        # The windows are views and the starts are contiguous slices, so only the Δx need gathering, with take.
+        x_legs = np.lib.stride_tricks.sliding_window_view(x_sums, L.nx, axis=1).take(L.nx + L.x, axis=1)
+        x_legs -= x_sums[:, None, L.nx:2*L.nx]
+
+        for Δt in L.t:
+            # Tracing a link against its orientation counts against the overlap.
+            # But for Δt < 0 the difference of cumulative sums comes out negative, which accounts for that automatically.
+            # Again every start is in a contiguous slice, so no fancy indexing is needed.
+            t_path = t_sums[L.nt + Δt:2*L.nt + Δt] - t_sums[L.nt:2*L.nt]
+
+            # Then the spatial legs start from the time we reached, which we can find by rolling the starting times.
+            x_path = x_legs.take((np.arange(L.nt) + Δt) % L.nt, axis=0)
 
             # Rather than compute (m+P)^2 - m^2 we can save some arithmetic by opening up the parens.
             #
             #   (m+P)^2 - m^2 = 2Pm + P^2
             #
             # (m really means m - δv/W in the constrained case.)
-            # On our non-looping taxicab route P^2 = |P|,
-            Psq = T+X
-            # because P is ±1 on every nonzero link.
-            #
-            # We can use the threaded indexing in numpy to pull out only the needed links
-            # in the correct directions at the correct coordinates, and account for them with the
-            # appropriate signs.
-            Pm = (sign * Links[(direction, *coordinates)]).sum(axis=1)
+            # On our non-looping taxicab route P^2 = |P| = |Δt| + |Δx|, because P is ±1 on every nonzero link.
+            Psq = np.abs(Δt) + np.abs(L.x)
+            # x_path is freshly allocated, so we can build the exponent in place in it,
+            # rather than allocating a new volume's worth of temporaries for every operation.
+            Pm = x_path
+            Pm += t_path[:, None, :]
             #
             # We summed over the links but we still have the volume averaging to accomplish.
             # However, the averaging has to be of the observable, meaning that we have to
             # average AFTER computing the reweighting factor,
-            result[Δt,Δx]= np.exp(-1/(2*kappa) * (2*Pm + Psq)).mean(axis=0)
+            exponent = Pm
+            exponent *= 2
+            exponent += Psq[None, :, None]
+            exponent *= weight
+            result[Δt] = np.exp(exponent, out=exponent).mean(axis=(0, 2))
 
         return result
 
 
-class SpinSusceptibility(Scalar, Observable):
+class SpinSusceptibility(Scalar, Observable, vectorized=True):
     r'''
     The *spin susceptibility* is the spacetime integral of the :class:`~.Spin_Spin` correlator $S_{\Delta x}$,
 
@@ -232,9 +193,9 @@ class SpinSusceptibility(Scalar, Observable):
 
     @staticmethod
     def default(S, Spin_Spin):
-        return np.sum(Spin_Spin.real)
+        return np.sum(Spin_Spin.real, axis=(-2, -1))
     
-class SpinSusceptibilityScaled(SpinSusceptibility):
+class SpinSusceptibilityScaled(SpinSusceptibility, vectorized=True):
     r'''
     At the critical point and in the CFT the :class:`~.SpinSusceptibility` has a known expected scaling that comes from the scaling dimension $\Delta$ of $e^{i\phi}$
 
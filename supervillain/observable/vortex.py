@@ -2,7 +2,7 @@ import numpy as np
 from supervillain.observable import Observable, Scalar, Constrained, NotVillain
 import supervillain.action
 
-class Vortex_Vortex(NotVillain, Constrained, Observable):
+class Vortex_Vortex(NotVillain, Constrained, Observable, vectorized=True):
     r'''
 
     In the constrained model the vortex correlations are given by
@@ -24,13 +24,15 @@ class Vortex_Vortex(NotVillain, Constrained, Observable):
 
         L = S.Lattice
 
+        # Both the exponential and the autocorrelation broadcast over the leading configuration axis,
+        # so every configuration is transformed in one batched FFT.
         vortex = np.exp(2j*np.pi * v / S.W)
 
-        return L.correlation(vortex, vortex)
+        return L.autocorrelation(vortex)
 
 
 
-class VortexSusceptibility(NotVillain, Constrained, Scalar, Observable):
+class VortexSusceptibility(NotVillain, Constrained, Scalar, Observable, vectorized=True):
     r'''
     The *vortex susceptibility* is the spacetime integral of the :class:`~.Vortex_Vortex` correlator $V_{\Delta x}$,
 
@@ -41,10 +43,10 @@ class VortexSusceptibility(NotVillain, Constrained, Scalar, Observable):
 
     @staticmethod
     def default(S, Vortex_Vortex):
-        return np.sum(Vortex_Vortex.real)
+        return np.sum(Vortex_Vortex.real, axis=(-2, -1))
 
 
-class VortexSusceptibilityScaled(VortexSusceptibility):
+class VortexSusceptibilityScaled(VortexSusceptibility, vectorized=True):
     r'''
     At the critical point and in the CFT the :class:`~.VortexSusceptibility` has a known expected scaling that comes from the scaling dimension $\Delta$ of $e^{2\pi i v/W}$.
 
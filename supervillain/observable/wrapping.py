@@ -1,7 +1,7 @@
 from supervillain.observable import Scalar, Observable
 import numpy as np
 
-class TorusWrapping(Observable):
+class TorusWrapping(Observable, vectorized=True):
     r'''
     Both the :class:`~.Villain` and :class:`~.Worldline` formulations have integer-valued numbers that wrap the spatial torus.
 
@@ -38,21 +38,21 @@ class TorusWrapping(Observable):
 
         return m.sum(axis=(-2,-1)) / S.Lattice.dims
 
-class TWrapping(Scalar, Observable):
+class TWrapping(Scalar, Observable, vectorized=True):
     r'''
     Just the time component of :class:`~.TorusWrapping`.
     '''
 
     @staticmethod
     def default(S, TorusWrapping):
-        return TorusWrapping[0]
+        return TorusWrapping[..., 0]
 
 
-class XWrapping(Scalar, Observable):
+class XWrapping(Scalar, Observable, vectorized=True):
     r'''
     Just the space component of :class:`~.TorusWrapping`.
     '''
 
     @staticmethod
     def default(S, TorusWrapping):
-        return TorusWrapping[1]
+        return TorusWrapping[..., 1]
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+
+import pytest
+
+import numpy as np
+import supervillain
+import generate
+import harness
+
+equality_threshold = 1e-12
+
+####
+#### Lattice
+####
+
+# The autocorrelation takes a real-input shortcut that the general correlation does not,
+# so we check them against one another.  Both even and odd sizes matter for the real transforms.
+
+def random_form(shape, is_complex):
+    rng = np.random.default_rng(seed=len(shape) + sum(shape))
+    result = rng.normal(size=shape)
+    if is_complex:
+        result = result + 1j * rng.normal(size=shape)
+    return result
+
+@pytest.mark.parametrize('batch', ((), (5,)))
+@pytest.mark.parametrize('is_complex', (False, True))
+@pytest.mark.parametrize('N', (3, 4, 7, 8))
+def test_autocorrelation_matches_correlation(N, is_complex, batch):
+    L = generate.Lattice(N)
+    f = random_form(batch + L.dims, is_complex)
+
+    auto = L.autocorrelation(f)
+    assert auto.shape == f.shape
+    assert np.iscomplexobj(auto) == is_complex
+
+    difference = np.abs(auto - L.correlation(f, f))
+    assert (difference < equality_threshold).all().item()
+
+####
+#### Observables
+####
+
+# Correlators built from the autocorrelation of real fields are real.
+
+@pytest.mark.parametrize('observable', ('ActionTwoPoint', 'Winding_Winding'))
+@pytest.mark.parametrize('action', ('villain', 'worldline'))
+@harness.for_each_test_ensemble
+def test_real_correlator(action, N, kappa, W, observable, configurations=1000, ):
+    ensemble = generate.cached_ensemble(action, configurations, N, kappa, W)
+    assert np.issubdtype(getattr(ensemble, observable).dtype, np.floating)
+
+@pytest.mark.parametrize('observable', ('Action_Action', ))
+@pytest.mark.parametrize('action', ('villain', 'worldline'))
+@harness.for_each_test_ensemble
+def test_real_derived_correlator(action, N, kappa, W, observable, configurations=1000, ):
+    ensemble = generate.cached_ensemble(action, configurations, N, kappa, W)
+    bootstrap = supervillain.analysis.Bootstrap(ensemble, 20)
+    assert np.issubdtype(getattr(bootstrap, observable).dtype, np.floating)